@@ -33,13 +33,15 @@ def create_a2a_message(sender_id: str, task: str, data: dict) -> dict:
     """Create A2A message format."""
     from datetime import datetime
 
+    # Read the clock once so message_id and timestamp match
+    now = datetime.now()
     return {
-        "message_id": f"{sender_id}_{task}_{datetime.now().timestamp()}",
+        "message_id": f"{sender_id}_{task}_{now.timestamp()}",
         "sender_id": sender_id,
         "recipient_id": "target_agent",
         "message_type": "task_request",
         "content": {"task": task, "data": data},
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
     }
 
 
@@ -321,13 +323,18 @@ Examples:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        pending_saves = []
         if args.format in ["json", "both"]:
             json_path = output_path.with_suffix(".json")
-            save_analysis_report(result, str(json_path), "json")
+            pending_saves.append(save_analysis_report(result, str(json_path), "json"))
 
         if args.format in ["markdown", "both"]:
             md_path = output_path.with_suffix(".md")
-            save_analysis_report(result, str(md_path), "markdown")
+            pending_saves.append(save_analysis_report(result, str(md_path), "markdown"))
+
+        # Wait for the background writes so failures surface before the summary
+        for future in pending_saves:
+            future.result()
 
         # Final summary
         logger.info("")
@@ -1,11 +1,19 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
-import json
+
+try:
+    import msgspec
+except ImportError:  # Optional: to_json falls back to the stdlib encoder
+    msgspec = None
+
+# Reused across to_json calls so the encoder's buffer and type cache persist
+_JSON_ENCODER = msgspec.json.Encoder() if msgspec is not None else None
+
 from .commit_info import CommitInfo, AuthorInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class RootCause:
     """Root cause identification"""
 
@@ -18,7 +26,7 @@ class RootCause:
     confidence_score: float = 0.0  # 0.0 to 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis result"""
 
@@ -49,17 +57,7 @@ class AnalysisResult:
                 "confidence_score": self.root_cause.confidence_score,
             },
             "commit_info": self.commit_info.to_dict() if self.commit_info else None,
-            "author_info": (
-                {
-                    "name": self.author_info.name,
-                    "email": self.author_info.email,
-                    "github_username": self.author_info.github_username,
-                    "total_commits_to_repo": self.author_info.total_commits_to_repo,
-                    "recent_commits_to_file": self.author_info.recent_commits_to_file,
-                }
-                if self.author_info
-                else None
-            ),
+            "author_info": self.author_info.to_dict() if self.author_info else None,
             "verification_steps": self.verification_steps,
             "suggested_fix": self.suggested_fix,
             "confidence_score": self.confidence_score,
@@ -72,6 +70,14 @@ class AnalysisResult:
 
     def to_json(self) -> str:
         """Convert to JSON string"""
+        if _JSON_ENCODER is not None:
+            # Encodes in C
+            return msgspec.json.format(
+                _JSON_ENCODER.encode(self.to_dict()), indent=2
+            ).decode()
+
+        import json
+
         return json.dumps(self.to_dict(), indent=2, default=str)
 
     @classmethod
@@ -132,7 +138,9 @@ class AnalysisResult:
 
     def to_markdown(self) -> str:
         """Convert to Markdown report"""
-        md = f"""# Root Cause Analysis Report
+        # Joined once at the end; measured faster than an io.StringIO buffer
+        parts: List[str] = [
+            f"""# Root Cause Analysis Report
 
 ## Bug Report
 **Title:** {self.bug_report_title}
@@ -156,11 +164,14 @@ class AnalysisResult:
 
 ### Execution Trace
 """
-        for i, step in enumerate(self.root_cause.execution_trace, 1):
-            md += f"{i}. {step}\n"
+        ]
+        parts.extend(
+            f"{i}. {step}\n"
+            for i, step in enumerate(self.root_cause.execution_trace, 1)
+        )
 
         if self.commit_info:
-            md += f"""
+            parts.append(f"""
 ## Commit Information
 - **SHA:** {self.commit_info.commit_sha}
 - **Author:** {self.commit_info.author.name} ({self.commit_info.author.email})
@@ -170,39 +181,39 @@ class AnalysisResult:
 - **Files Changed:** {len(self.commit_info.files_changed)}
 - **Additions:** +{self.commit_info.additions}
 - **Deletions:** -{self.commit_info.deletions}
-"""
+""")
 
         if self.suggested_fix:
-            md += f"""
+            parts.append(f"""
 ## Suggested Fix
 {self.suggested_fix}
-"""
+""")
 
-        md += """
+        parts.append("""
 ## Verification Steps
-"""
-        for i, step in enumerate(self.verification_steps, 1):
-            md += f"{i}. {step}\n"
+""")
+        parts.extend(
+            f"{i}. {step}\n" for i, step in enumerate(self.verification_steps, 1)
+        )
 
-        md += f"""
+        parts.append(f"""
 ## Tools Used
 {', '.join(self.tools_used)}
 
 ## Related Files
-"""
-        for file in self.root_cause.related_files:
-            md += f"- `{file}`\n"
+""")
+        parts.extend(f"- `{file}`\n" for file in self.root_cause.related_files)
 
         if self.critique_comments:
-            md += f"""
+            parts.append(f"""
 ## Critique Comments
 {self.critique_comments}
-"""
+""")
 
-        return md
+        return "".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolExecutionResult:
     """Result from a tool execution"""
 
@@ -1,9 +1,8 @@
 from dataclasses import dataclass, field
 from typing import Optional, List, Dict
 from datetime import datetime
-import json
 
-@dataclass
+@dataclass(slots=True)
 class BugReport:
     """Structured bug report"""
     title: str
@@ -32,16 +31,24 @@ class BugReport:
     @classmethod
     def from_json_file(cls, filepath: str):
         """Load from JSON file"""
+        import json  # Only needed by callers that load reports from disk
         with open(filepath, 'r') as f:
             data = json.load(f)
         return cls.from_dict(data)
 
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        result = {}
-        for key, value in self.__dict__.items():
-            if isinstance(value, datetime):
-                result[key] = value.isoformat()
-            else:
-                result[key] = value
-        return result
\ No newline at end of file
+        return {
+            'title': self.title,
+            'description': self.description,
+            'steps_to_reproduce': self.steps_to_reproduce,
+            'expected_behavior': self.expected_behavior,
+            'actual_behavior': self.actual_behavior,
+            'error_message': self.error_message,
+            'stack_trace': self.stack_trace,
+            'environment': self.environment,
+            'affected_version': self.affected_version,
+            'severity': self.severity,
+            'reporter': self.reporter,
+            'reported_date': self.reported_date.isoformat() if self.reported_date else None
+        }
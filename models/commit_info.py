@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class AuthorInfo:
     """Information about code author"""
     name: str
@@ -11,7 +11,17 @@ class AuthorInfo:
     total_commits_to_repo: Optional[int] = None
     recent_commits_to_file: Optional[int] = None
 
-@dataclass
+    def to_dict(self) -> dict:
+        """Convert to dictionary"""
+        return {
+            'name': self.name,
+            'email': self.email,
+            'github_username': self.github_username,
+            'total_commits_to_repo': self.total_commits_to_repo,
+            'recent_commits_to_file': self.recent_commits_to_file
+        }
+
+@dataclass(slots=True)
 class CommitInfo:
     """Detailed commit information"""
     commit_sha: str
@@ -33,20 +43,14 @@ class CommitInfo:
             'commit_message': self.commit_message,
             'commit_date': self.commit_date.isoformat(),
             'commit_url': self.commit_url,
-            'author': {
-                'name': self.author.name,
-                'email': self.author.email,
-                'github_username': self.author.github_username,
-                'total_commits_to_repo': self.author.total_commits_to_repo,
-                'recent_commits_to_file': self.author.recent_commits_to_file
-            },
+            'author': self.author.to_dict(),
             'files_changed': self.files_changed,
             'additions': self.additions,
             'deletions': self.deletions,
             'patch': self.patch
         }
 
-@dataclass
+@dataclass(slots=True)
 class FileBlameInfo:
     """Git blame information for specific lines"""
     file_path: str
@@ -5,13 +5,21 @@ Simple A2A test for the orchestrator
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated calls reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/json"})
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
 
 
 def test_agent_card():
     """Test the agent card endpoint"""
     print("🔍 Testing Agent Card...")
     try:
-        response = requests.get("http://localhost:8002/.well-known/agent-card.json")
+        response = _SESSION.get(
+            "http://localhost:8002/.well-known/agent-card.json", timeout=5
+        )
         if response.status_code == 200:
             card = response.json()
             print("✅ Agent Card Retrieved!")
@@ -23,10 +31,16 @@ def test_agent_card():
             print(f"\n📋 Available Skills ({len(skills)}):")
             for i, skill in enumerate(skills, 1):
                 if isinstance(skill, dict):
-                    print(f"   {i}. {skill.get('name', 'Unknown')}")
-                    print(f"      ID: {skill.get('id', 'No ID')}")
+                    get = skill.get
+                    name, sid, desc = (
+                        get("name", "Unknown"),
+                        get("id", "No ID"),
+                        get("description", "No description"),
+                    )
                     print(
-                        f"      Description: {skill.get('description', 'No description')}"
+                        f"   {i}. {name}\n"
+                        f"      ID: {sid}\n"
+                        f"      Description: {desc}"
                     )
                 else:
                     print(f"   {i}. {skill}")
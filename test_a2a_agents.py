@@ -4,7 +4,8 @@ Test script to demonstrate A2A agent compatibility and message flow.
 """
 
 import sys
-import json
+import functools
+from pprint import pformat
 from pathlib import Path
 from datetime import datetime
 
@@ -17,25 +18,43 @@ from agents.critique_agent import CritiqueAgent
 from models.bug_report import BugReport
 from utils.config import config
 
+try:
+    import orjson
+except ImportError:  # Optional: fall back to pprint
+    orjson = None
+
+
+def _pp(obj) -> str:
+    """Pretty-print an A2A payload for debugging output.
+
+    Uses orjson's indented JSON when available, and pprint otherwise or when
+    the payload holds values JSON cannot represent.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    return pformat(obj, width=120, sort_dicts=False)
+
 
 def create_test_message(sender_id: str, task: str, data: dict) -> dict:
     """Create A2A test message."""
+    # One clock read keeps the ID and timestamp consistent and halves the cost
+    now = datetime.now()
     return {
-        "message_id": f"{sender_id}_{task}_{datetime.now().timestamp()}",
+        "message_id": f"{sender_id}_{task}_{now.timestamp()}",
         "sender_id": sender_id,
         "recipient_id": "target_agent",
         "message_type": "task_request",
         "content": {"task": task, "data": data},
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
     }
 
 
-def test_agent_info():
-    """Test agent information retrieval."""
-    print("=" * 60)
-    print("TESTING A2A AGENT INFORMATION")
-    print("=" * 60)
-
+@functools.lru_cache(maxsize=1)
+def _build_agents():
+    """Create the agents once; every test below reuses the same instances."""
     # Initialize agents (without GitHub client for info test)
     try:
         github_client = GitHubClient(
@@ -47,15 +66,25 @@ def test_agent_info():
 
     rca_agent = RootCauseAgent(config.gemini_api_key, github_client)
     critique_agent = CritiqueAgent(config.gemini_api_key, github_client)
+    return rca_agent, critique_agent
+
+
+def test_agent_info():
+    """Test agent information retrieval."""
+    print("=" * 60)
+    print("TESTING A2A AGENT INFORMATION")
+    print("=" * 60)
+
+    rca_agent, critique_agent = _build_agents()
 
     # Test agent info
     print("\n🤖 RCA Agent Information:")
     rca_info = rca_agent.get_agent_info()
-    print(json.dumps(rca_info, indent=2))
+    print(_pp(rca_info))
 
     print("\n🎭 Critique Agent Information:")
     critique_info = critique_agent.get_agent_info()
-    print(json.dumps(critique_info, indent=2))
+    print(_pp(critique_info))
 
     return rca_agent, critique_agent
 
@@ -74,21 +103,21 @@ def test_message_validation():
     )
 
     print("\n✅ Testing valid message:")
-    print(json.dumps(valid_message, indent=2))
+    print(_pp(valid_message))
 
     response = rca_agent.process(valid_message)
     print("\n📤 RCA Agent Response:")
-    print(json.dumps(response, indent=2))
+    print(_pp(response))
 
     # Test invalid message
     invalid_message = {"invalid": "message"}
 
     print("\n❌ Testing invalid message:")
-    print(json.dumps(invalid_message, indent=2))
+    print(_pp(invalid_message))
 
     response = rca_agent.process(invalid_message)
     print("\n📤 RCA Agent Response:")
-    print(json.dumps(response, indent=2))
+    print(_pp(response))
 
 
 def test_task_routing():
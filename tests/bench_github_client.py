@@ -0,0 +1,69 @@
+"""Benchmarks for GitHub client tool output.
+
+Not collected by default; run explicitly with:
+
+    pytest tests/bench_github_client.py --benchmark-only
+"""
+
+import pytest
+from unittest.mock import patch
+from types import SimpleNamespace
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+pytest.importorskip("pytest_benchmark")
+
+from core.github_client import GitHubClient
+
+
+def build_repo(num_files: int, max_depth: int) -> SimpleNamespace:
+    """Build a fake repository with ``num_files`` files and two subdirectories per level."""
+    listing = {}
+
+    def add_dir(path: str, depth: int):
+        prefix = f"{path}/" if path else ''
+        entries = [
+            SimpleNamespace(name=f"file{i}.py", path=f"{prefix}file{i}.py", type='file', size=100 * i)
+            for i in range(num_files)
+        ]
+        if depth < max_depth:
+            for i in range(2):
+                sub_path = f"{prefix}dir{i}"
+                entries.append(SimpleNamespace(name=f"dir{i}", path=sub_path, type='dir', size=0))
+                add_dir(sub_path, depth + 1)
+        listing[path] = entries
+
+    add_dir('', 1)
+    return SimpleNamespace(get_contents=lambda path, ref: listing[path])
+
+
+@pytest.fixture
+def github_client():
+    """Create a GitHubClient instance with mocked GitHub."""
+    with patch('core.github_client.Github'):
+        yield GitHubClient("fake_token", "owner/repo", "main")
+
+
+@pytest.mark.parametrize("n_lines", [100, 10_000, 100_000])
+def test_search_in_file(benchmark, github_client, n_lines):
+    """Benchmark line matching and JSON output, with a match every tenth line."""
+    github_client._file_cache["f.py"] = "\n".join(
+        f"line {i} user" if i % 10 == 0 else f"line {i}" for i in range(n_lines)
+    )
+
+    result = benchmark(github_client.search_in_file, "f.py", "user")
+
+    assert f'"total_matches": {n_lines // 10}' in result
+
+
+@pytest.mark.parametrize("num_files,max_depth", [(10, 2), (10, 5), (100, 3)])
+def test_get_repository_structure(benchmark, github_client, num_files, max_depth):
+    """Benchmark tree building and JSON output for repositories of varying size."""
+    github_client.repo = build_repo(num_files, max_depth)
+
+    result = benchmark(github_client.get_repository_structure, max_depth)
+
+    assert '"file0.py"' in result
@@ -0,0 +1,17 @@
+"""Shared test fixtures."""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.config import _load_env
+
+
+@pytest.fixture(autouse=True)
+def _bust_caches():
+    """Clear the cached environment after each test."""
+    yield
+    _load_env.cache_clear()
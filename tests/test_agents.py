@@ -1,56 +1,150 @@
 """Tests for agent functionality."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+import copy
+from unittest.mock import Mock, patch, MagicMock, create_autospec
 import sys
 from pathlib import Path
 from datetime import datetime
+from types import SimpleNamespace
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from agents.root_cause_agent import RootCauseAgent
-from agents.critique_agent import CritiqueAgent
-from agents.orchestrator_agent import OrchestratorAgent
 from models.bug_report import BugReport
 from models.analysis_result import AnalysisResult, RootCause
-from core.github_client import GitHubClient
+
+# Fixed timestamp so the shared sample fixtures are deterministic
+_FIXED_TS = datetime(2024, 1, 1, 0, 0, 0)
+
+# Tool declarations the RCA agent exposes to the LLM
+EXPECTED_TOOLS = frozenset({
+    'get_repository_structure',
+    'search_code',
+    'get_file_content',
+    'get_directory_files',
+    'get_file_history',
+    'get_file_blame',
+    'get_commit_details',
+    'find_file_dependencies',
+    'search_in_file',
+    'find_when_line_was_added',
+    'get_recent_commits',
+})
+
+
+@pytest.fixture(scope="session")
+def agent_classes():
+    """Import the agent and client classes on first use.
+
+    The agents pull in google.genai and the client PyGithub, which are slow to
+    import, so collecting this module (e.g. with -k) does not pay for them.
+    """
+    from agents.root_cause_agent import RootCauseAgent
+    from agents.critique_agent import CritiqueAgent
+    from agents.orchestrator_agent import OrchestratorAgent
+    from core.github_client import GitHubClient
+    return SimpleNamespace(
+        RootCauseAgent=RootCauseAgent,
+        CritiqueAgent=CritiqueAgent,
+        OrchestratorAgent=OrchestratorAgent,
+        GitHubClient=GitHubClient,
+    )
+
+
+@pytest.fixture(scope="session")
+def github_client_attrs(agent_classes):
+    """Public GitHubClient attribute names, used as the client mock's spec_set."""
+    return [name for name in dir(agent_classes.GitHubClient) if not name.startswith('_')]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_genai_patches():
+    """Patch the Google Generative AI module in both agents for this test module."""
+    rca_patch = patch('agents.root_cause_agent.genai')
+    critique_patch = patch('agents.critique_agent.genai')
+    mocks = rca_patch.start(), critique_patch.start()
+    yield mocks
+    rca_patch.stop()
+    critique_patch.stop()
+
+
+@pytest.fixture(scope="session")
+def sample_bug_report():
+    """Create a sample bug report, shared across the test session."""
+    return BugReport(
+        title="Login fails with NoneType error",
+        description="Authentication fails when user doesn't exist",
+        steps_to_reproduce=["Go to login", "Enter invalid email", "Click login"],
+        expected_behavior="Show error message",
+        actual_behavior="Application crashes",
+        error_message="TypeError: 'NoneType' object has no attribute 'id'",
+        stack_trace="File 'login.py', line 45, in authenticate_user\n    return user.id"
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_analysis_result():
+    """Create a sample analysis result, shared across the test session."""
+    return AnalysisResult(
+        bug_report_title="Test Bug",
+        root_cause=RootCause(
+            file_path="src/auth/login.py",
+            line_numbers=[45],
+            code_snippet="return user.id",
+            explanation="User is None when not found"
+        ),
+        commit_info=None,
+        author_info=None,
+        verification_steps=[],
+        suggested_fix=None,
+        confidence_score=0.8,
+        tools_used=["get_file_content"],
+        iterations=5,
+        analysis_timestamp=_FIXED_TS
+    )
 
 class TestRootCauseAgent:
     """Test cases for RootCauseAgent class."""
     
-    @pytest.fixture
-    def mock_github_client(self):
-        """Create a mock GitHub client."""
-        return Mock(spec=GitHubClient)
+    @pytest.fixture(scope="module")
+    def mock_github_client(self, github_client_attrs):
+        """Create a mock GitHub client, shared by the tests in this class."""
+        return Mock(spec_set=github_client_attrs)
+
+    @pytest.fixture(autouse=True)
+    def reset_github_client(self, mock_github_client):
+        """Reset the shared GitHub client mock after each test."""
+        yield
+        mock_github_client.reset_mock(return_value=True, side_effect=True)
     
     @pytest.fixture
-    def mock_genai(self):
-        """Mock the Google Generative AI module."""
-        with patch('agents.root_cause_agent.genai') as mock:
-            yield mock
+    def mock_genai(self, mock_genai_patches):
+        """Mock the Google Generative AI module, reset after each test."""
+        mock = mock_genai_patches[0]
+        yield mock
+        mock.reset_mock(return_value=True, side_effect=True)
     
-    @pytest.fixture
-    def rca_agent(self, mock_genai, mock_github_client):
-        """Create a RootCauseAgent instance with mocks."""
-        return RootCauseAgent("fake_api_key", mock_github_client)
+    @pytest.fixture(scope="module")
+    def rca_agent(self, agent_classes, mock_genai_patches, mock_github_client):
+        """Create a RootCauseAgent instance with mocks, shared by the tests in this class."""
+        agent = agent_classes.RootCauseAgent("fake_api_key", mock_github_client)
+        # Keep the construction call out of the first test's assertions
+        mock_genai_patches[0].reset_mock()
+        return agent
     
-    @pytest.fixture
-    def sample_bug_report(self):
-        """Create a sample bug report for testing."""
-        return BugReport(
-            title="Login fails with NoneType error",
-            description="Authentication fails when user doesn't exist",
-            steps_to_reproduce=["Go to login", "Enter invalid email", "Click login"],
-            expected_behavior="Show error message",
-            actual_behavior="Application crashes",
-            error_message="TypeError: 'NoneType' object has no attribute 'id'",
-            stack_trace="File 'login.py', line 45, in authenticate_user\n    return user.id"
-        )
+    @pytest.fixture(autouse=True)
+    def reset_agent(self, rca_agent):
+        """Reset the shared agent's conversation state after each test."""
+        yield
+        rca_agent.conversation_history.clear()
+        rca_agent.tool_executions.clear()
+        rca_agent.improvement_feedback.clear()
+        rca_agent.client.reset_mock(return_value=True, side_effect=True)
     
-    def test_initialization(self, mock_genai, mock_github_client):
+    def test_initialization(self, agent_classes, mock_genai, mock_github_client):
         """Test RootCauseAgent initialization."""
-        agent = RootCauseAgent("test_key", mock_github_client)
+        agent = agent_classes.RootCauseAgent("test_key", mock_github_client)
         
         assert agent.github == mock_github_client
         assert agent.conversation_history == []
@@ -64,48 +158,35 @@ class TestRootCauseAgent:
         assert len(tools) == 1  # Should have 1 Tool object
         assert len(tools[0].function_declarations) == 11  # Should have 11 function declarations
         
-        function_names = [func.name for func in tools[0].function_declarations]
-        
-        expected_tools = [
-            'get_repository_structure',
-            'search_code',
-            'get_file_content',
-            'get_directory_files',
-            'get_file_history',
-            'get_file_blame',
-            'get_commit_details',
-            'find_file_dependencies',
-            'search_in_file',
-            'find_when_line_was_added',
-            'get_recent_commits'
-        ]
-        
-        for expected_tool in expected_tools:
-            assert expected_tool in function_names
-    
-    def test_execute_tool_get_file_content(self, rca_agent):
-        """Test tool execution for get_file_content."""
-        # Setup mock
-        rca_agent.github.get_file_content.return_value = "print('hello')"
-        
-        # Test
-        result = rca_agent._execute_tool('get_file_content', {'file_path': 'test.py'})
-        
-        # Assert
-        assert result == "print('hello')"
-        rca_agent.github.get_file_content.assert_called_once_with('test.py')
+        function_names = {func.name for func in tools[0].function_declarations}
+        assert EXPECTED_TOOLS <= function_names
     
-    def test_execute_tool_search_code(self, rca_agent):
-        """Test tool execution for search_code."""
+    @pytest.mark.parametrize("tool_name,parameters,expected_args", [
+        ('get_repository_structure', {}, (3,)),
+        ('get_repository_structure', {'max_depth': 1}, (1,)),
+        ('search_code', {'query': 'login'}, ('login',)),
+        ('get_file_content', {'file_path': 'test.py'}, ('test.py',)),
+        ('get_file_blame', {'file_path': 'test.py', 'line_start': 1, 'line_end': 5},
+         ('test.py', 1, 5)),
+        ('get_commit_details', {'commit_sha': 'abc123'}, ('abc123',)),
+        ('search_in_file', {'file_path': 'test.py', 'search_term': 'login'},
+         ('test.py', 'login')),
+        ('get_file_history', {'file_path': 'test.py'}, ('test.py', 10)),
+        ('find_when_line_was_added', {'file_path': 'test.py', 'line_numbers': [4]},
+         ('test.py', [4])),
+    ])
+    def test_execute_tool(self, rca_agent, tool_name, parameters, expected_args):
+        """Test tool execution is routed to the matching GitHub client method."""
         # Setup mock
-        rca_agent.github.search_code.return_value = '{"matches": []}'
+        method = getattr(rca_agent.github, tool_name)
+        method.return_value = '{"result": "ok"}'
         
         # Test
-        result = rca_agent._execute_tool('search_code', {'query': 'login'})
+        result = rca_agent._execute_tool(tool_name, parameters)
         
         # Assert
-        assert result == '{"matches": []}'
-        rca_agent.github.search_code.assert_called_once_with('login')
+        assert result == '{"result": "ok"}'
+        method.assert_called_once_with(*expected_args)
     
     def test_execute_tool_unknown(self, rca_agent):
         """Test tool execution with unknown tool."""
@@ -156,46 +237,41 @@ class TestRootCauseAgent:
 class TestCritiqueAgent:
     """Test cases for CritiqueAgent class."""
     
-    @pytest.fixture
-    def mock_github_client(self):
-        """Create a mock GitHub client."""
-        return Mock(spec=GitHubClient)
+    @pytest.fixture(scope="module")
+    def mock_github_client(self, github_client_attrs):
+        """Create a mock GitHub client, shared by the tests in this class."""
+        return Mock(spec_set=github_client_attrs)
+
+    @pytest.fixture(autouse=True)
+    def reset_github_client(self, mock_github_client):
+        """Reset the shared GitHub client mock after each test."""
+        yield
+        mock_github_client.reset_mock(return_value=True, side_effect=True)
     
     @pytest.fixture
-    def mock_genai(self):
-        """Mock the Google Generative AI module."""
-        with patch('agents.critique_agent.genai') as mock:
-            yield mock
+    def mock_genai(self, mock_genai_patches):
+        """Mock the Google Generative AI module, reset after each test."""
+        mock = mock_genai_patches[1]
+        yield mock
+        mock.reset_mock(return_value=True, side_effect=True)
     
-    @pytest.fixture
-    def critique_agent(self, mock_genai, mock_github_client):
-        """Create a CritiqueAgent instance with mocks."""
-        return CritiqueAgent("fake_api_key", mock_github_client)
+    @pytest.fixture(scope="module")
+    def critique_agent(self, agent_classes, mock_genai_patches, mock_github_client):
+        """Create a CritiqueAgent instance with mocks, shared by the tests in this class."""
+        agent = agent_classes.CritiqueAgent("fake_api_key", mock_github_client)
+        # Keep the construction call out of the first test's assertions
+        mock_genai_patches[1].reset_mock()
+        return agent
     
-    @pytest.fixture
-    def sample_analysis_result(self):
-        """Create a sample analysis result for testing."""
-        return AnalysisResult(
-            bug_report_title="Test Bug",
-            root_cause=RootCause(
-                file_path="src/auth/login.py",
-                line_numbers=[45],
-                code_snippet="return user.id",
-                explanation="User is None when not found"
-            ),
-            commit_info=None,
-            author_info=None,
-            verification_steps=[],
-            suggested_fix=None,
-            confidence_score=0.8,
-            tools_used=["get_file_content"],
-            iterations=5,
-            analysis_timestamp=datetime.now()
-        )
+    @pytest.fixture(autouse=True)
+    def reset_agent(self, critique_agent):
+        """Reset the shared agent's LLM client mock after each test."""
+        yield
+        critique_agent.client.reset_mock(return_value=True, side_effect=True)
     
-    def test_initialization(self, mock_genai, mock_github_client):
+    def test_initialization(self, agent_classes, mock_genai, mock_github_client):
         """Test CritiqueAgent initialization."""
-        agent = CritiqueAgent("test_key", mock_github_client)
+        agent = agent_classes.CritiqueAgent("test_key", mock_github_client)
         
         assert agent.github == mock_github_client
         mock_genai.Client.assert_called_once_with(api_key="test_key")
@@ -227,58 +303,37 @@ class TestCritiqueAgent:
         assert 'suggested_improvements' in result
 
 class TestOrchestratorAgent:
-    """Test cases for OrchestratorAgent class."""
-    
-    @pytest.fixture
-    def mock_rca_agent(self):
-        """Create a mock RCA agent."""
-        return Mock(spec=RootCauseAgent)
+    """Test cases for OrchestratorAgent class.
+
+    run_analysis updates the result it gets back from the RCA agent, so each
+    test hands it a deep copy of the shared sample_analysis_result.
+    """
     
-    @pytest.fixture
-    def mock_critique_agent(self):
-        """Create a mock Critique agent."""
-        return Mock(spec=CritiqueAgent)
+    @pytest.fixture(scope="module")
+    def mock_rca_agent(self, agent_classes):
+        """Create a mock RCA agent, shared by the tests in this class."""
+        return create_autospec(agent_classes.RootCauseAgent, instance=True)
     
-    @pytest.fixture
-    def orchestrator(self, mock_rca_agent, mock_critique_agent):
-        """Create an OrchestratorAgent instance with mocks."""
-        return OrchestratorAgent(mock_rca_agent, mock_critique_agent)
+    @pytest.fixture(scope="module")
+    def mock_critique_agent(self, agent_classes):
+        """Create a mock Critique agent, shared by the tests in this class."""
+        return create_autospec(agent_classes.CritiqueAgent, instance=True)
     
-    @pytest.fixture
-    def sample_bug_report(self):
-        """Create a sample bug report for testing."""
-        return BugReport(
-            title="Test Bug",
-            description="Test description",
-            steps_to_reproduce=["Step 1"],
-            expected_behavior="Expected",
-            actual_behavior="Actual"
-        )
+    @pytest.fixture(autouse=True)
+    def reset_agent_mocks(self, mock_rca_agent, mock_critique_agent):
+        """Reset the shared agent mocks after each test."""
+        yield
+        mock_rca_agent.reset_mock(return_value=True, side_effect=True)
+        mock_critique_agent.reset_mock(return_value=True, side_effect=True)
     
     @pytest.fixture
-    def sample_analysis_result(self):
-        """Create a sample analysis result for testing."""
-        return AnalysisResult(
-            bug_report_title="Test Bug",
-            root_cause=RootCause(
-                file_path="test.py",
-                line_numbers=[10],
-                code_snippet="test code",
-                explanation="Test explanation"
-            ),
-            commit_info=None,
-            author_info=None,
-            verification_steps=[],
-            suggested_fix=None,
-            confidence_score=0.8,
-            tools_used=["test_tool"],
-            iterations=3,
-            analysis_timestamp=datetime.now()
-        )
+    def orchestrator(self, agent_classes, mock_rca_agent, mock_critique_agent):
+        """Create an OrchestratorAgent instance with mocks."""
+        return agent_classes.OrchestratorAgent(mock_rca_agent, mock_critique_agent)
     
-    def test_initialization(self, mock_rca_agent, mock_critique_agent):
+    def test_initialization(self, agent_classes, mock_rca_agent, mock_critique_agent):
         """Test OrchestratorAgent initialization."""
-        orchestrator = OrchestratorAgent(mock_rca_agent, mock_critique_agent)
+        orchestrator = agent_classes.OrchestratorAgent(mock_rca_agent, mock_critique_agent)
         
         assert orchestrator.rca_agent == mock_rca_agent
         assert orchestrator.critique_agent == mock_critique_agent
@@ -286,7 +341,7 @@ class TestOrchestratorAgent:
     def test_run_analysis_approved(self, orchestrator, sample_bug_report, sample_analysis_result):
         """Test analysis workflow with approved critique."""
         # Setup mocks
-        orchestrator.rca_agent.analyze_bug.return_value = sample_analysis_result
+        orchestrator.rca_agent.analyze_bug.return_value = copy.deepcopy(sample_analysis_result)
         orchestrator.critique_agent.critique.return_value = {
             'approved': True,
             'confidence_adjustment': 0.1,
@@ -309,7 +364,7 @@ class TestOrchestratorAgent:
     def test_run_analysis_not_approved(self, orchestrator, sample_bug_report, sample_analysis_result):
         """Test analysis workflow with rejected critique."""
         # Setup mocks
-        orchestrator.rca_agent.analyze_bug.return_value = sample_analysis_result
+        orchestrator.rca_agent.analyze_bug.return_value = copy.deepcopy(sample_analysis_result)
         orchestrator.critique_agent.critique.return_value = {
             'approved': False,
             'confidence_adjustment': -0.2,
@@ -330,7 +385,7 @@ class TestOrchestratorAgent:
     def test_run_analysis_multiple_iterations(self, orchestrator, sample_bug_report, sample_analysis_result):
         """Test analysis workflow with multiple refinement iterations."""
         # Setup mocks - first critique fails, second approves
-        orchestrator.rca_agent.analyze_bug.return_value = sample_analysis_result
+        orchestrator.rca_agent.analyze_bug.return_value = copy.deepcopy(sample_analysis_result)
         orchestrator.critique_agent.critique.side_effect = [
             {
                 'approved': False,
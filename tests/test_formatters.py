@@ -0,0 +1,143 @@
+"""Tests for report formatting and saving."""
+
+import pytest
+import tarfile
+from unittest.mock import Mock
+from datetime import datetime
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.analysis_result import AnalysisResult, RootCause
+from utils.formatters import (
+    _REPORT_WRITER,
+    format_analysis_report,
+    save_analysis_report,
+    save_analysis_reports,
+)
+
+
+def make_result(i: int) -> AnalysisResult:
+    """Create a distinct analysis result for batch saving."""
+    return AnalysisResult(
+        bug_report_title=f"Bug {i}",
+        root_cause=RootCause(
+            file_path=f"src/module_{i}.py",
+            line_numbers=[i],
+            code_snippet="return user.id",
+            explanation="User is None when not found"
+        ),
+        commit_info=None,
+        author_info=None,
+        verification_steps=[],
+        suggested_fix=None,
+        confidence_score=0.8,
+        tools_used=["get_file_content"],
+        iterations=1,
+        analysis_timestamp=datetime(2024, 1, 1, 0, 0, i)
+    )
+
+
+class TestFormatAnalysisReport:
+    """Test cases for format_analysis_report."""
+
+    @pytest.mark.parametrize("format_type,method", [('json', 'to_json'), ('markdown', 'to_markdown')])
+    def test_dispatches_to_result_method(self, format_type, method):
+        """Test that formats call the method on the result, so overrides are used."""
+        result = Mock(spec=AnalysisResult)
+        getattr(result, method).return_value = "formatted"
+
+        assert format_analysis_report(result, format_type) == "formatted"
+        getattr(result, method).assert_called_once_with()
+
+    def test_unknown_format(self):
+        """Test that an unknown format raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown format type: html"):
+            format_analysis_report(make_result(0), 'html')
+
+
+class TestSaveAnalysisReport:
+    """Test cases for save_analysis_report."""
+
+    @staticmethod
+    def drain_writer():
+        """Wait until the writer thread has finished earlier writes and their callbacks."""
+        _REPORT_WRITER.submit(lambda: None).result()
+
+    def test_writes_report(self, tmp_path, caplog):
+        """Test that the report is written in the background without logging errors."""
+        result = make_result(1)
+        path = tmp_path / "report.json"
+
+        save_analysis_report(result, str(path)).result()
+        self.drain_writer()
+
+        assert path.read_text(encoding='utf-8') == result.to_json()
+        assert not caplog.records
+
+    def test_write_error_is_logged(self, tmp_path, caplog):
+        """Test that a failed write is logged as well as raised from the future."""
+        path = tmp_path / "missing" / "report.json"
+
+        future = save_analysis_report(make_result(1), str(path))
+        with pytest.raises(FileNotFoundError):
+            future.result()
+        self.drain_writer()
+
+        assert [r.levelname for r in caplog.records] == ["ERROR"]
+        assert f"Failed to save report to {path}" in caplog.text
+
+
+class TestSaveAnalysisReports:
+    """Test cases for save_analysis_reports."""
+
+    @pytest.fixture
+    def results(self):
+        """Create five distinct analysis results."""
+        return [make_result(i) for i in range(5)]
+
+    @pytest.mark.parametrize("format_type,extension", [('json', 'json'), ('markdown', 'md')])
+    def test_individual_files(self, tmp_path, results, format_type, extension):
+        """Test that batches up to the threshold are written as separate files."""
+        paths = save_analysis_reports(results, str(tmp_path), format_type)
+
+        names = [f"report_{i:04d}.{extension}" for i in range(1, 6)]
+        assert paths == [str(tmp_path / name) for name in names]
+        assert sorted(p.name for p in tmp_path.iterdir()) == names
+        for path, result in zip(paths, results):
+            assert Path(path).read_text(encoding='utf-8') == format_analysis_report(result, format_type)
+
+    def test_threshold_is_inclusive(self, tmp_path, results):
+        """Test that a batch exactly at the threshold is not archived."""
+        paths = save_analysis_reports(results, str(tmp_path), archive_threshold=5)
+
+        assert len(paths) == 5
+        assert not (tmp_path / "reports.tar").exists()
+
+    def test_archive(self, tmp_path, results):
+        """Test that batches above the threshold are streamed into one tar archive."""
+        paths = save_analysis_reports(results, str(tmp_path / "out"), archive_threshold=4)
+
+        archive_path = tmp_path / "out" / "reports.tar"
+        assert paths == [str(archive_path)]
+        assert [p.name for p in archive_path.parent.iterdir()] == ["reports.tar"]
+
+        with tarfile.open(archive_path) as archive:
+            members = archive.getmembers()
+            assert [m.name for m in members] == [f"report_{i:04d}.json" for i in range(1, 6)]
+            for member, result in zip(members, results):
+                content = archive.extractfile(member).read().decode('utf-8')
+                assert content == format_analysis_report(result, 'json')
+                assert member.mtime == int(result.analysis_timestamp.timestamp())
+
+    @pytest.mark.parametrize("archive_threshold", [50, 0])
+    def test_unknown_format_writes_nothing(self, tmp_path, results, archive_threshold):
+        """Test that an unknown format is rejected before any file or directory is created."""
+        out_dir = tmp_path / "out"
+
+        with pytest.raises(ValueError, match="Unknown format type: html"):
+            save_analysis_reports(results, str(out_dir), 'html', archive_threshold)
+
+        assert not out_dir.exists()
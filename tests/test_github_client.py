@@ -2,7 +2,9 @@
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from datetime import datetime
 import sys
 from pathlib import Path
 
@@ -14,17 +16,24 @@ from core.github_client import GitHubClient
 class TestGitHubClient:
     """Test cases for GitHubClient class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_github(self):
-        """Create a mock GitHub instance."""
+        """Create a mock GitHub instance, shared by the tests in this class."""
         with patch('core.github_client.Github') as mock:
             yield mock
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def github_client(self, mock_github):
-        """Create a GitHubClient instance with mocked GitHub."""
+        """Create a GitHubClient instance with mocked GitHub, shared by the tests in this class."""
         return GitHubClient("fake_token", "owner/repo", "main")
     
+    @pytest.fixture(autouse=True)
+    def reset_github_client(self, github_client):
+        """Reset the shared client's cache and repository mock after each test."""
+        yield
+        github_client._file_cache.clear()
+        github_client.repo.reset_mock(return_value=True, side_effect=True)
+    
     def test_initialization(self, mock_github, github_client):
         """Test GitHubClient initialization."""
         assert github_client.branch == "main"
@@ -34,8 +43,7 @@ class TestGitHubClient:
     def test_get_file_content_success(self, github_client):
         """Test successful file content retrieval."""
         # Setup mock
-        mock_content = Mock()
-        mock_content.decoded_content = b"print('hello world')"
+        mock_content = SimpleNamespace(decoded_content=b"print('hello world')")
         github_client.repo.get_contents.return_value = mock_content
         
         # Test
@@ -73,16 +81,8 @@ class TestGitHubClient:
     def test_get_repository_structure(self, github_client):
         """Test repository structure retrieval."""
         # Setup mock contents
-        mock_file = Mock()
-        mock_file.type = 'file'
-        mock_file.name = 'README.md'
-        mock_file.path = 'README.md'
-        mock_file.size = 1234
-        
-        mock_dir = Mock()
-        mock_dir.type = 'dir'
-        mock_dir.name = 'src'
-        mock_dir.path = 'src'
+        mock_file = SimpleNamespace(type='file', name='README.md', path='README.md', size=1234)
+        mock_dir = SimpleNamespace(type='dir', name='src', path='src')
         
         github_client.repo.get_contents.return_value = [mock_file, mock_dir]
         
@@ -96,22 +96,18 @@ class TestGitHubClient:
         assert result_dict['README.md']['type'] == 'file'
         assert result_dict['src/']['type'] == 'directory'
     
-    def test_search_code(self, github_client):
+    def test_search_code(self, github_client, monkeypatch):
         """Test code search functionality."""
         # Setup mock files
-        mock_file1 = Mock()
-        mock_file1.path = 'src/auth/login.py'
-        mock_file1.size = 500
-        
-        mock_file2 = Mock()
-        mock_file2.path = 'tests/test_auth.py'
-        mock_file2.size = 300
+        mock_file1 = SimpleNamespace(path='src/auth/login.py', size=500)
+        mock_file2 = SimpleNamespace(path='tests/test_auth.py', size=300)
+        contents = {
+            'src/auth/login.py': "def login_user():\n    pass",
+            'tests/test_auth.py': "def test_login():\n    pass"
+        }
         
-        github_client._get_all_files = Mock(return_value=[mock_file1, mock_file2])
-        github_client.get_file_content = Mock(side_effect=[
-            "def login_user():\n    pass",
-            "def test_login():\n    pass"
-        ])
+        monkeypatch.setattr(github_client, '_get_all_files', lambda: [mock_file1, mock_file2])
+        monkeypatch.setattr(github_client, 'get_file_content', contents.__getitem__)
         
         # Test
         result = github_client.search_code("login")
@@ -124,11 +120,7 @@ class TestGitHubClient:
     def test_get_directory_files(self, github_client):
         """Test directory file listing."""
         # Setup mock
-        mock_file = Mock()
-        mock_file.name = 'app.py'
-        mock_file.path = 'src/app.py'
-        mock_file.type = 'file'
-        mock_file.size = 1000
+        mock_file = SimpleNamespace(name='app.py', path='src/app.py', type='file', size=1000)
         
         github_client.repo.get_contents.return_value = [mock_file]
         
@@ -144,14 +136,18 @@ class TestGitHubClient:
     def test_get_file_history(self, github_client):
         """Test file history retrieval."""
         # Setup mock commit
-        mock_commit = Mock()
-        mock_commit.sha = 'abc123def456'
-        mock_commit.commit.message = 'Fix login bug'
-        mock_commit.commit.author.name = 'John Doe'
-        mock_commit.commit.author.email = 'john@example.com'
-        mock_commit.commit.author.date = Mock()
-        mock_commit.commit.author.date.isoformat.return_value = '2024-01-15T10:30:00'
-        mock_commit.html_url = 'https://github.com/owner/repo/commit/abc123'
+        mock_commit = SimpleNamespace(
+            sha='abc123def456',
+            commit=SimpleNamespace(
+                message='Fix login bug',
+                author=SimpleNamespace(
+                    name='John Doe',
+                    email='john@example.com',
+                    date=datetime(2024, 1, 15, 10, 30, 0),
+                ),
+            ),
+            html_url='https://github.com/owner/repo/commit/abc123',
+        )
         
         github_client.repo.get_commits.return_value = [mock_commit]
         
@@ -168,31 +164,29 @@ class TestGitHubClient:
     
     def test_get_commit_details(self, github_client):
         """Test commit details retrieval."""
-        # Setup mock commit
-        mock_commit = Mock()
-        mock_commit.sha = 'abc123def456'
-        mock_commit.commit.message = 'Fix authentication bug'
-        mock_commit.commit.author.name = 'Jane Smith'
-        mock_commit.commit.author.email = 'jane@example.com'
-        mock_commit.commit.author.date.isoformat.return_value = '2024-01-15T14:20:00'
-        mock_commit.commit.committer.name = 'Jane Smith'
-        mock_commit.commit.committer.email = 'jane@example.com'
-        mock_commit.commit.committer.date.isoformat.return_value = '2024-01-15T14:20:00'
-        mock_commit.stats.additions = 10
-        mock_commit.stats.deletions = 5
-        mock_commit.stats.total = 15
-        mock_commit.html_url = 'https://github.com/owner/repo/commit/abc123'
-        
         # Mock file changes
-        mock_file = Mock()
-        mock_file.filename = 'src/auth/login.py'
-        mock_file.status = 'modified'
-        mock_file.additions = 8
-        mock_file.deletions = 3
-        mock_file.changes = 11
-        mock_file.patch = '@@ -10,3 +10,8 @@ def login():\n+    if not user:\n+        return None'
+        mock_file = SimpleNamespace(
+            filename='src/auth/login.py',
+            status='modified',
+            additions=8,
+            deletions=3,
+            changes=11,
+            patch='@@ -10,3 +10,8 @@ def login():\n+    if not user:\n+        return None',
+        )
         
-        mock_commit.files = [mock_file]
+        # Setup mock commit
+        jane = SimpleNamespace(
+            name='Jane Smith',
+            email='jane@example.com',
+            date=datetime(2024, 1, 15, 14, 20, 0),
+        )
+        mock_commit = SimpleNamespace(
+            sha='abc123def456',
+            commit=SimpleNamespace(message='Fix authentication bug', author=jane, committer=jane),
+            stats=SimpleNamespace(additions=10, deletions=5, total=15),
+            html_url='https://github.com/owner/repo/commit/abc123',
+            files=[mock_file],
+        )
         github_client.repo.get_commit.return_value = mock_commit
         
         # Test
@@ -207,7 +201,7 @@ class TestGitHubClient:
         assert len(result_dict['files_changed']) == 1
         assert result_dict['files_changed'][0]['filename'] == 'src/auth/login.py'
     
-    def test_search_in_file(self, github_client):
+    def test_search_in_file(self, github_client, monkeypatch):
         """Test searching within a file."""
         # Setup mock file content
         file_content = """def login_user(email, password):
@@ -218,7 +212,7 @@ class TestGitHubClient:
         return user.id
     return None"""
         
-        github_client.get_file_content = Mock(return_value=file_content)
+        monkeypatch.setattr(github_client, 'get_file_content', lambda _: file_content)
         
         # Test
         result = github_client.search_in_file("src/auth/login.py", "user")
@@ -230,25 +224,30 @@ class TestGitHubClient:
         assert result_dict['total_matches'] == 5  # 'user' appears 5 times (login_user, find_user, user var, user check, user.id)
         assert len(result_dict['matches']) == 5
     
-    def test_find_when_line_was_added(self, github_client):
+    def test_find_when_line_was_added(self, github_client, monkeypatch):
         """Test finding when specific lines were added."""
-        # Setup mock commit with patch
-        mock_commit = Mock()
-        mock_commit.sha = 'abc123def456'
-        mock_commit.commit.author.name = 'John Doe'
-        mock_commit.commit.author.email = 'john@example.com'
-        mock_commit.commit.author.date.isoformat.return_value = '2024-01-15T10:30:00'
-        mock_commit.commit.message = 'Add user validation'
-        mock_commit.html_url = 'https://github.com/owner/repo/commit/abc123'
-        
         # Mock file with patch
-        mock_file = Mock()
-        mock_file.filename = 'src/auth/login.py'
-        mock_file.patch = '@@ -40,0 +41,3 @@ def authenticate_user():\n+    if not user:\n+        return None\n+    return user.id'
+        mock_file = SimpleNamespace(
+            filename='src/auth/login.py',
+            patch='@@ -40,0 +41,3 @@ def authenticate_user():\n+    if not user:\n+        return None\n+    return user.id',
+        )
         
-        mock_commit.files = [mock_file]
+        # Setup mock commit with patch
+        mock_commit = SimpleNamespace(
+            sha='abc123def456',
+            commit=SimpleNamespace(
+                message='Add user validation',
+                author=SimpleNamespace(
+                    name='John Doe',
+                    email='john@example.com',
+                    date=datetime(2024, 1, 15, 10, 30, 0),
+                ),
+            ),
+            html_url='https://github.com/owner/repo/commit/abc123',
+            files=[mock_file],
+        )
         github_client.repo.get_commits.return_value = [mock_commit]
-        github_client._line_in_patch = Mock(return_value=True)
+        monkeypatch.setattr(github_client, '_line_in_patch', Mock(return_value=True))
         
         # Test
         result = github_client.find_when_line_was_added("src/auth/login.py", [42, 43])
@@ -260,21 +259,19 @@ class TestGitHubClient:
         assert result_dict['42']['commit_sha'] == 'abc123d'
         assert result_dict['42']['author'] == 'John Doe'
     
-    def test_error_handling(self, github_client):
+    def test_error_handling(self, github_client, monkeypatch):
         """Test error handling in various methods."""
         # Test repository structure error
         github_client.repo.get_contents.side_effect = Exception("API Error")
         
         result = github_client.get_repository_structure()
-        result_dict = json.loads(result)
-        assert 'error' in result_dict
+        assert '"error"' in result
         
         # Test search code error
-        github_client._get_all_files = Mock(side_effect=Exception("Search Error"))
+        monkeypatch.setattr(github_client, '_get_all_files', Mock(side_effect=Exception("Search Error")))
         
         result = github_client.search_code("test")
-        result_dict = json.loads(result)
-        assert 'error' in result_dict
+        assert '"error"' in result
 
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""Tests for logging configuration."""
+
+import pytest
+import logging
+import logging.handlers
+import time
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils import logger as rca_logger
+from utils.logger import _BufferedFileHandler, setup_logger
+
+
+def make_record(level: int, message: str) -> logging.LogRecord:
+    """Create a log record for feeding a handler directly."""
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def stop_writer(queue_handler: logging.Handler):
+    """Stop the background listener draining a file writer's queue, as at exit."""
+    listener = next(l for l in rca_logger._listeners if l.queue is queue_handler.queue)
+    rca_logger._listeners.remove(listener)
+    rca_logger._stop_listener(listener)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Log file path whose writers are stopped and forgotten after the test."""
+    path = tmp_path / "logs" / "rca.log"
+    existing = len(rca_logger._listeners)
+    yield path
+    for listener in rca_logger._listeners[existing:]:
+        rca_logger._stop_listener(listener)
+    del rca_logger._listeners[existing:]
+    rca_logger._file_writers.pop(path.resolve(), None)
+
+
+@pytest.fixture
+def make_logger(request):
+    """Set up uniquely named loggers and remove their handlers afterwards."""
+    loggers = []
+
+    def make(suffix: str, level: str, log_file: Path) -> logging.Logger:
+        logger = setup_logger(f"{request.node.name}.{suffix}", level, str(log_file))
+        loggers.append(logger)
+        return logger
+
+    yield make
+    for logger in loggers:
+        logger.handlers.clear()
+
+
+class TestFileWriter:
+    """Test cases for the shared background file writer."""
+
+    def test_loggers_share_queue_handler(self, make_logger, log_file):
+        """Test that loggers on one path, at any level, share one writer."""
+        first = make_logger("a", "INFO", log_file)
+        second = make_logger("b", "DEBUG", log_file.parent / ".." / "logs" / log_file.name)
+
+        assert first.handlers[1] is second.handlers[1]
+        assert isinstance(first.handlers[1], logging.handlers.QueueHandler)
+        assert len([l for l in rca_logger._listeners if l.queue is first.handlers[1].queue]) == 1
+
+    def test_records_stay_in_order(self, make_logger, log_file):
+        """Test that records from two loggers reach the file in logging order."""
+        first = make_logger("a", "INFO", log_file)
+        second = make_logger("b", "DEBUG", log_file)
+
+        for i in range(500):
+            first.info("a %d", i)
+            second.debug("b %d", i)
+        stop_writer(first.handlers[1])
+
+        messages = [line.rsplit(" - ", 1)[1] for line in log_file.read_text().splitlines()]
+        assert messages == [m for i in range(500) for m in (f"a {i}", f"b {i}")]
+
+    def test_file_complete_after_stop(self, make_logger, log_file):
+        """Test that stopping the listener drains the queue and flushes the buffer."""
+        logger = make_logger("a", "INFO", log_file)
+
+        for i in range(2000):
+            logger.info("line %d", i)
+        stop_writer(logger.handlers[1])
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 2000
+        assert lines[-1].endswith("INFO - line 1999")
+
+
+class TestBufferedFileHandler:
+    """Test cases for _BufferedFileHandler."""
+
+    def test_opens_file_on_first_record(self, tmp_path):
+        """Test that the file is not created until something is logged."""
+        path = tmp_path / "rca.log"
+        handler = _BufferedFileHandler(path)
+
+        assert not path.exists()
+        handler.handle(make_record(logging.INFO, "first"))
+        assert path.exists()
+        handler.close()
+
+    def test_error_flushed_immediately(self, tmp_path):
+        """Test that an ERROR record reaches disk without waiting for the timer."""
+        path = tmp_path / "rca.log"
+        handler = _BufferedFileHandler(path, flush_interval=60)
+
+        handler.handle(make_record(logging.INFO, "buffered"))
+        assert path.read_text() == ""
+
+        handler.handle(make_record(logging.ERROR, "failed"))
+        assert path.read_text() == "buffered\nfailed\n"
+        handler.close()
+
+    def test_timer_flushes_buffer(self, tmp_path):
+        """Test that buffered records are flushed once the interval passes."""
+        path = tmp_path / "rca.log"
+        handler = _BufferedFileHandler(path, flush_interval=0.05)
+
+        handler.handle(make_record(logging.INFO, "buffered"))
+        deadline = time.monotonic() + 5
+        while path.read_text() == "" and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert path.read_text() == "buffered\n"
+        handler.close()
+
+    def test_close_writes_buffer_and_cancels_timer(self, tmp_path):
+        """Test that closing writes out buffered records and leaves no timer running."""
+        path = tmp_path / "rca.log"
+        handler = _BufferedFileHandler(path, flush_interval=60)
+
+        handler.handle(make_record(logging.INFO, "buffered"))
+        handler.close()
+
+        assert path.read_text() == "buffered\n"
+        assert handler._flush_timer is None
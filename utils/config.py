@@ -1,35 +1,49 @@
 """Configuration management for the RCA system."""
 
 import os
-from typing import Optional
+import functools
+from typing import Dict, Optional
 from dotenv import load_dotenv
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env() -> Dict[str, str]:
+    """Load the .env file once and return a snapshot of the environment.
+
+    Tests that change the environment call ``_load_env.cache_clear()``.
+    """
+    load_dotenv()
+    return os.environ.copy()
+
+
 class Config:
     """Configuration class for RCA system."""
 
-    def __init__(self):
-        load_dotenv()
-
+    # (attribute, environment variable, type, default)
+    _SCHEMA = (
         # GitHub Configuration
-        self.github_token = os.getenv("GITHUB_TOKEN")
-        self.repo_owner = os.getenv("REPO_OWNER")
-        self.repo_name = os.getenv("REPO_NAME")
-        self.default_branch = os.getenv("DEFAULT_BRANCH", "main")
-
+        ("github_token", "GITHUB_TOKEN", str, None),
+        ("repo_owner", "REPO_OWNER", str, None),
+        ("repo_name", "REPO_NAME", str, None),
+        ("default_branch", "DEFAULT_BRANCH", str, "main"),
         # Gemini Configuration
-        self.gemini_api_key = os.getenv("GEMINI_API_KEY")
-        self.gemini_model = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
-
+        ("gemini_api_key", "GEMINI_API_KEY", str, None),
+        ("gemini_model", "GEMINI_MODEL", str, "gemini-2.5-flash"),
         # Agent Configuration
-        self.max_rca_iterations = int(os.getenv("MAX_RCA_ITERATIONS", 15))
-        self.max_refinement_iterations = int(os.getenv("MAX_REFINEMENT_ITERATIONS", 2))
-        self.max_api_retries = int(os.getenv("MAX_API_RETRIES", 5))
-        self.retry_base_delay = float(os.getenv("RETRY_BASE_DELAY", 1.0))
-
+        ("max_rca_iterations", "MAX_RCA_ITERATIONS", int, 15),
+        ("max_refinement_iterations", "MAX_REFINEMENT_ITERATIONS", int, 2),
+        ("max_api_retries", "MAX_API_RETRIES", int, 5),
+        ("retry_base_delay", "RETRY_BASE_DELAY", float, 1.0),
         # Logging Configuration
-        self.log_level = os.getenv("LOG_LEVEL", "INFO")
-        self.log_file = os.getenv("LOG_FILE", "rca_agent.log")
+        ("log_level", "LOG_LEVEL", str, "INFO"),
+        ("log_file", "LOG_FILE", str, "rca_agent.log"),
+    )
+
+    def __init__(self):
+        env = _load_env()
+        for attr, key, cast, default in self._SCHEMA:
+            value = env.get(key)
+            setattr(self, attr, cast(value) if value is not None else default)
 
     def validate(self) -> bool:
         """Validate that required configuration is present."""
@@ -1,12 +1,181 @@
 """Logging configuration for the RCA system."""
 
+import atexit
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Dict
 from rich.console import Console
 from rich.logging import RichHandler
 
+# Separator line around analysis start/complete banners
+_BAR = "=" * 80
+
+# Background listeners writing log files, stopped at exit
+_listeners = []
+
+# Queue handler for each log file, keyed by resolved path
+_file_writers: Dict[Path, logging.Handler] = {}
+_file_writers_lock = threading.Lock()
+
+def _stop_listener(listener: logging.handlers.QueueListener):
+    """Drain a listener's queued records and close its file handlers."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+@atexit.register
+def _stop_listeners():
+    """Drain queued file records and close the files before the interpreter exits."""
+    for listener in _listeners:
+        _stop_listener(listener)
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders each second's timestamp once per thread.
+    
+    With a seconds-resolution ``datefmt`` every record logged within the same
+    second gets the same ``asctime``, so it is reused instead of calling
+    ``time.strftime`` again.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._local = threading.local()
+    
+    def formatTime(self, record, datefmt=None):
+        if datefmt is None:
+            # The default format includes milliseconds, so it cannot be reused
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        local = self._local
+        if getattr(local, "second", None) != second:
+            local.text = super().formatTime(record, datefmt)
+            local.second = second
+        return local.text
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that buffers writes and flushes on a timer, not per record.
+    
+    The file is opened on the first record with a large buffer; records at
+    ERROR or above are flushed straight away so failures reach disk promptly.
+    """
+    
+    def __init__(self, filename, flush_interval: float = 0.2, buffer_size: int = 1 << 16):
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self._flush_timer = None
+        super().__init__(filename, delay=True)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record):
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            super().flush()
+    
+    def flush(self):
+        # StreamHandler.emit calls this after every record; batch them instead
+        with self.lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _timed_flush(self):
+        with self.lock:
+            self._flush_timer = None
+            super().flush()
+    
+    def close(self):
+        with self.lock:
+            # Closing the stream writes out the buffer, so any timer the close
+            # itself scheduled is not needed
+            super().close()
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+@functools.lru_cache(maxsize=None)
+def _level_number(level: str) -> int:
+    """Resolve a level name such as 'info' to its logging constant."""
+    return getattr(logging, level.upper())
+
+@functools.lru_cache(maxsize=8)
+def _console_handler(level: str) -> logging.Handler:
+    """Build the console handler for a level.
+    
+    Cached so repeated setup_logger calls reuse the handler instead of
+    building a new one.
+    """
+    console = Console()
+    if console.is_terminal:
+        # Console handler with rich formatting
+        console_handler = RichHandler(
+            console=console,
+            show_time=True,
+            show_path=False,
+            rich_tracebacks=True
+        )
+        
+        # Format for console
+        console_format = logging.Formatter(
+            fmt="%(message)s",
+            datefmt="[%X]"
+        )
+    else:
+        # Redirected output (files, CI pipes) gets plain lines in Rich's column
+        # layout, skipping its markup rendering and traceback introspection
+        console_handler = logging.StreamHandler(console.file)
+        console_format = _CachedTimeFormatter(
+            fmt="%(asctime)s %(levelname)-8s %(message)s",
+            datefmt="[%X]"
+        )
+    console_handler.setLevel(_level_number(level))
+    console_handler.setFormatter(console_format)
+    return console_handler
+
+def _file_writer(log_file: str) -> logging.Handler:
+    """Return the queue handler feeding the background writer for a log file.
+    
+    There is one buffered file handler and listener thread per resolved path,
+    so loggers sharing a file share its buffer and their records stay in order.
+    """
+    log_path = Path(log_file).resolve()
+    with _file_writers_lock:
+        queue_handler = _file_writers.get(log_path)
+        if queue_handler is not None:
+            return queue_handler
+        
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        file_handler = _BufferedFileHandler(log_path)
+        file_handler.setLevel(logging.DEBUG)  # Always log everything to file
+        
+        # Format for file
+        file_format = _CachedTimeFormatter(
+            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
+        file_handler.setFormatter(file_format)
+        
+        # File I/O runs on a listener thread; the logging call only enqueues
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        listener.start()
+        _listeners.append(listener)
+        
+        queue_handler = _file_writers[log_path] = logging.handlers.QueueHandler(log_queue)
+        return queue_handler
+
 def setup_logger(name: str = "rca_agent", level: str = "INFO", log_file: str = None) -> logging.Logger:
     """Set up logger with rich formatting and optional file output.
     
@@ -19,44 +188,15 @@ def setup_logger(name: str = "rca_agent", level: str = "INFO", log_file: str = N
         Configured logger
     """
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(_level_number(level))
     
     # Clear existing handlers
     logger.handlers.clear()
-    
-    # Console handler with rich formatting
-    console = Console()
-    console_handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=False,
-        rich_tracebacks=True
-    )
-    console_handler.setLevel(getattr(logging, level.upper()))
-    
-    # Format for console
-    console_format = logging.Formatter(
-        fmt="%(message)s",
-        datefmt="[%X]"
-    )
-    console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    logger.addHandler(_console_handler(level.upper()))
     
     # File handler if specified
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_path)
-        file_handler.setLevel(logging.DEBUG)  # Always log everything to file
-        
-        # Format for file
-        file_format = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        logger.addHandler(_file_writer(log_file))
     
     return logger
 
@@ -65,28 +205,28 @@ def log_tool_execution(logger: logging.Logger, tool_name: str, parameters: dict,
     """Log tool execution details."""
     if success:
         logger.info(f"Tool {tool_name} completed in {execution_time:.2f}s")
-        logger.debug(f"   Parameters: {parameters}")
+        logger.debug("   Parameters: %s", parameters)
     else:
         logger.error(f"Tool {tool_name} failed after {execution_time:.2f}s")
         logger.error(f"   Error: {error}")
-        logger.debug(f"   Parameters: {parameters}")
+        logger.debug("   Parameters: %s", parameters)
 
 def log_analysis_start(logger: logging.Logger, bug_title: str, repo: str):
     """Log analysis start."""
-    logger.info("="*80)
+    logger.info(_BAR)
     logger.info("ROOT CAUSE ANALYSIS STARTED")
-    logger.info("="*80)
-    logger.info(f"Bug: {bug_title}")
-    logger.info(f"Repository: {repo}")
-    logger.info(f"Timestamp: {datetime.now().isoformat()}")
+    logger.info(_BAR)
+    logger.info("Bug: %s", bug_title)
+    logger.info("Repository: %s", repo)
+    logger.info("Timestamp: %s", datetime.now().isoformat())
     logger.info("")
 
 def log_analysis_complete(logger: logging.Logger, iterations: int, confidence: float):
     """Log analysis completion."""
     logger.info("")
-    logger.info("="*80)
+    logger.info(_BAR)
     logger.info("ANALYSIS COMPLETE")
-    logger.info("="*80)
-    logger.info(f"Iterations: {iterations}")
-    logger.info(f"Confidence: {confidence:.2f}")
-    logger.info("="*80)
\ No newline at end of file
+    logger.info(_BAR)
+    logger.info("Iterations: %s", iterations)
+    logger.info("Confidence: %.2f", confidence)
+    logger.info(_BAR)
\ No newline at end of file